@@ -4,15 +4,43 @@ WhatsApp EOD Report Generator - Engine Module
 Core functionality for parsing and summarizing WhatsApp chats.
 """
 
-from .parser import parse_whatsapp_chat, save_to_json, validate_messages
-from .summarizer import generate_eod_report, save_report
+from .parser import (
+    parse_whatsapp_chat,
+    parse_whatsapp_export,
+    save_to_json,
+    validate_messages,
+    group_messages_by_date,
+)
+from .summarizer import generate_eod_report, save_report, run_prompt
+from .rollup import generate_rollup_reports
+from .daily import generate_daily_reports
+from .structured import generate_structured_report, render_report, save_structured_report
+from .analytics import compute_chat_analytics, render_analytics_appendix
+from .threads import build_thread_index, get_conversation_segments, pack_threads, chunk_threads
+from .incremental import generate_incremental_report, diff_reports
 
 __all__ = [
     'parse_whatsapp_chat',
+    'parse_whatsapp_export',
     'save_to_json',
     'validate_messages',
+    'group_messages_by_date',
     'generate_eod_report',
     'save_report',
+    'run_prompt',
+    'generate_rollup_reports',
+    'generate_daily_reports',
+    'generate_structured_report',
+    'render_report',
+    'save_structured_report',
+    'compute_chat_analytics',
+    'render_analytics_appendix',
+    'build_thread_index',
+    'get_conversation_segments',
+    'pack_threads',
+    'chunk_threads',
+    'generate_incremental_report',
+    'diff_reports',
 ]
 
 
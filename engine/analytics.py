@@ -0,0 +1,219 @@
+"""
+Chat Analytics - Local Activity Statistics
+
+Answers "who was active, when, and how much" from parsed messages using
+columnar NumPy aggregation, without sending anything to the AI provider.
+The results can be appended to an EOD report at zero token cost.
+"""
+
+import sys
+from operator import itemgetter
+
+WEEKDAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+# A message from a different sender within this many minutes counts as a reply
+RESPONSE_WINDOW_MINUTES = 240
+
+# Messages closer together than this belong to the same burst
+BURST_GAP_MINUTES = 10
+MIN_BURST_SIZE = 3
+
+
+def _import_numpy():
+    """Import numpy, exiting with install instructions if it is missing"""
+    try:
+        import numpy as np
+    except ImportError:
+        print("❌ ERROR: numpy package not installed.")
+        print("Install with: pip install numpy")
+        sys.exit(1)
+    return np
+
+
+def timestamps_to_minutes(timestamps, np):
+    """
+    Convert WhatsApp timestamps to minutes since the Unix epoch.
+
+    The parser guarantees the fixed 17-character layout DD/MM/YYYY, HH:MM,
+    so the digits are decoded from one byte matrix instead of one strptime per message.
+    """
+    raw = np.frombuffer(''.join(timestamps).encode('ascii'), dtype=np.uint8).reshape(-1, 17)
+
+    def field(start, end):
+        value = np.zeros(len(raw), dtype=np.int64)
+        for col in range(start, end):
+            value = value * 10 + (raw[:, col] - ord('0'))
+        return value
+
+    day = field(0, 2)
+    month = field(3, 5)
+    year = field(6, 10)
+    hour = field(12, 14)
+    minute = field(15, 17)
+
+    months = ((year - 1970) * 12 + month - 1).astype('datetime64[M]')
+    days = months.astype('datetime64[D]').astype(np.int64) + day - 1
+    return days * 1440 + hour * 60 + minute
+
+
+def compute_chat_analytics(messages, response_window=RESPONSE_WINDOW_MINUTES,
+                           burst_gap=BURST_GAP_MINUTES, min_burst_size=MIN_BURST_SIZE):
+    """
+    Compute per-sender, per-hour and per-weekday activity statistics
+
+    Args:
+        messages: List of parsed message dictionaries (chronological order)
+        response_window: Max minutes between messages for a reply to count
+        burst_gap: Max minutes between messages in the same burst
+        min_burst_size: Minimum messages for a burst to be reported
+
+    Returns:
+        Dictionary of plain Python values (safe to JSON-serialize)
+    """
+    np = _import_numpy()
+
+    if not messages:
+        return {
+            'total_messages': 0,
+            'senders': [],
+            'hourly': [0] * 24,
+            'weekday': {name: 0 for name in WEEKDAY_NAMES},
+            'bursts': {'count': 0, 'messages': 0, 'gap_minutes': burst_gap,
+                       'min_size': min_burst_size, 'top': []},
+        }
+
+    n = len(messages)
+
+    # Columnar encoding: one integer code per sender, one minute value per message
+    sender_column = list(map(itemgetter('sender'), messages))
+    senders = list(dict.fromkeys(sender_column))
+    sender_ids = {sender: i for i, sender in enumerate(senders)}
+    codes = np.fromiter(map(sender_ids.__getitem__, sender_column), dtype=np.int64, count=n)
+    num_senders = len(senders)
+    minutes = timestamps_to_minutes(list(map(itemgetter('timestamp'), messages)), np)
+
+    counts = np.bincount(codes, minlength=num_senders)
+    hourly = np.bincount((minutes // 60) % 24, minlength=24)
+    # 1970-01-01 was a Thursday (index 3 with Monday = 0)
+    weekday = np.bincount((minutes // 1440 + 3) % 7, minlength=7)
+
+    # Response latency: a sender switch within the window is treated as a reply
+    gaps = np.diff(minutes)
+    is_reply = (codes[1:] != codes[:-1]) & (gaps >= 0) & (gaps <= response_window)
+    responders = codes[1:][is_reply]
+    reply_gaps = gaps[is_reply]
+    reply_counts = np.bincount(responders, minlength=num_senders)
+    reply_totals = np.bincount(responders, weights=reply_gaps, minlength=num_senders)
+
+    # Per-sender medians from a (sender, gap) histogram; gaps are whole minutes
+    # bounded by the window, so this avoids sorting every reply
+    histogram = np.bincount(
+        responders * (response_window + 1) + reply_gaps,
+        minlength=num_senders * (response_window + 1)
+    ).reshape(num_senders, response_window + 1).cumsum(axis=1)
+    has_replies = reply_counts > 0
+    lower = (histogram <= ((reply_counts - 1) // 2)[:, None]).sum(axis=1)
+    upper = (histogram <= (reply_counts // 2)[:, None]).sum(axis=1)
+    medians = np.where(has_replies, (lower + upper) / 2, np.nan)
+    means = np.divide(reply_totals, reply_counts, out=np.full(num_senders, np.nan), where=has_replies)
+
+    # Bursts: runs of messages separated by at most burst_gap minutes
+    new_burst = np.concatenate(([True], (gaps < 0) | (gaps > burst_gap)))
+    burst_starts = np.flatnonzero(new_burst)
+    burst_ends = np.concatenate((burst_starts[1:], [n])) - 1
+    burst_sizes = burst_ends - burst_starts + 1
+    burst_minutes = minutes[burst_ends] - minutes[burst_starts]
+
+    reported = np.flatnonzero(burst_sizes >= min_burst_size)
+    top_bursts = reported[np.argsort(-burst_sizes[reported], kind='stable')][:5]
+
+    sender_stats = []
+    for idx in np.argsort(-counts, kind='stable'):
+        sender_stats.append({
+            'sender': senders[idx],
+            'messages': int(counts[idx]),
+            'share': float(counts[idx] / n),
+            'replies': int(reply_counts[idx]),
+            'median_response_minutes': None if np.isnan(medians[idx]) else float(medians[idx]),
+            'mean_response_minutes': None if np.isnan(means[idx]) else float(means[idx]),
+        })
+
+    return {
+        'total_messages': n,
+        'first_timestamp': messages[0]['timestamp'],
+        'last_timestamp': messages[-1]['timestamp'],
+        'senders': sender_stats,
+        'hourly': hourly.tolist(),
+        'weekday': dict(zip(WEEKDAY_NAMES, weekday.tolist())),
+        'bursts': {
+            'count': int(len(reported)),
+            'messages': int(burst_sizes[reported].sum()),
+            'gap_minutes': burst_gap,
+            'min_size': min_burst_size,
+            'top': [
+                {
+                    'start': messages[burst_starts[b]]['timestamp'],
+                    'messages': int(burst_sizes[b]),
+                    'duration_minutes': int(burst_minutes[b]),
+                    # Only the reported bursts need participant counts
+                    'participants': len(np.unique(codes[burst_starts[b]:burst_ends[b] + 1])),
+                }
+                for b in top_bursts
+            ],
+        },
+    }
+
+
+def _format_minutes(value):
+    """Format a latency in minutes for display"""
+    if value is None:
+        return "-"
+    if value >= 60:
+        return f"{value / 60:.1f} h"
+    return f"{value:.0f} min"
+
+
+def render_analytics_appendix(stats, top_senders=10):
+    """Render analytics as a markdown appendix for the EOD report"""
+    lines = ["", "---", "", "### Appendix: Chat Activity"]
+
+    if not stats['total_messages']:
+        lines.append("No messages to analyze.")
+        return "\n".join(lines) + "\n"
+
+    lines.append(
+        f"**{stats['total_messages']} messages** from **{len(stats['senders'])} senders** "
+        f"({stats['first_timestamp']} to {stats['last_timestamp']})"
+    )
+
+    lines += ["", "#### Most Active Senders", "",
+              "| Sender | Messages | Share | Replies | Median Response |",
+              "|--------|----------|-------|---------|-----------------|"]
+    for sender in stats['senders'][:top_senders]:
+        lines.append(
+            f"| {sender['sender']} | {sender['messages']} | {sender['share']:.0%} | "
+            f"{sender['replies']} | {_format_minutes(sender['median_response_minutes'])} |"
+        )
+
+    peak = max(stats['hourly']) or 1
+    lines += ["", "#### Activity by Hour", "", "| Hour | Messages | |", "|------|----------|---|"]
+    for hour, count in enumerate(stats['hourly']):
+        if count:
+            lines.append(f"| {hour:02d}:00 | {count} | {'█' * max(1, round(20 * count / peak))} |")
+
+    lines += ["", "#### Activity by Weekday", "",
+              "| " + " | ".join(stats['weekday']) + " |",
+              "|" + "-----|" * len(stats['weekday']),
+              "| " + " | ".join(str(count) for count in stats['weekday'].values()) + " |"]
+
+    bursts = stats['bursts']
+    lines += ["", "#### Conversation Bursts", "",
+              f"{bursts['count']} bursts (≥{bursts['min_size']} messages, ≤{bursts['gap_minutes']} min apart) "
+              f"covering {bursts['messages']} messages."]
+    for burst in bursts['top']:
+        lines.append(
+            f"- {burst['start']}: {burst['messages']} messages over {burst['duration_minutes']} min, "
+            f"{burst['participants']} participants"
+        )
+
+    return "\n".join(lines) + "\n"
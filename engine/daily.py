@@ -0,0 +1,129 @@
+"""
+Per-Day Report Generation
+
+Splits a multi-day export into calendar days and generates one EOD report per
+day with bounded concurrency, skipping days whose report on disk is up to date.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .parser import group_messages_by_date
+from .summarizer import generate_eod_report, save_report
+
+DEFAULT_MAX_WORKERS = 4
+
+
+def generate_reports_by_day(messages_by_day, site_name=None, provider=None, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Generate one EOD report per day concurrently
+
+    Args:
+        messages_by_day: Dict of ISO date -> messages (see group_messages_by_date)
+        site_name: Optional site name override
+        provider: AI provider (defaults to AI_PROVIDER env var)
+        max_workers: Maximum number of concurrent AI calls
+
+    Yields:
+        (day, report, error) tuples in completion order; error is None on success
+    """
+    if not messages_by_day:
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(generate_eod_report, day_messages, site_name, provider): day
+            for day, day_messages in messages_by_day.items()
+        }
+        for future in as_completed(futures):
+            day = futures[future]
+            try:
+                report = future.result()
+            except Exception as e:
+                yield day, None, e
+                continue
+
+            if report.startswith("❌ ERROR"):
+                yield day, None, RuntimeError(report)
+            else:
+                yield day, report, None
+
+
+def daily_report_path(output_dir, base_name, day):
+    """Dated output path for one day's report"""
+    return os.path.join(output_dir, f"{base_name}_{day}_eod_report.md")
+
+
+def daily_meta_path(output_dir, base_name, day):
+    """Sidecar recording what one day's report was generated from"""
+    return os.path.join(output_dir, f"{base_name}_{day}_eod_meta.json")
+
+
+def is_daily_report_current(output_dir, base_name, day, message_count, site_name=None):
+    """
+    True if the day's report exists and covered the same messages and site name
+
+    A day exported mid-day gains messages later, so its report is stale even
+    though the file exists (same check as the rollup summary cache).
+    """
+    meta_path = daily_meta_path(output_dir, base_name, day)
+    if not os.path.exists(daily_report_path(output_dir, base_name, day)) or not os.path.exists(meta_path):
+        return False
+
+    with open(meta_path, 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    return meta.get('message_count') == message_count and meta.get('site_name') == site_name
+
+
+def save_daily_meta(output_dir, base_name, day, message_count, site_name=None):
+    """Record the message count and site name a day's report was generated from"""
+    meta = {'date': day, 'site_name': site_name, 'message_count': message_count}
+    with open(daily_meta_path(output_dir, base_name, day), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+
+
+def generate_daily_reports(messages, output_dir="output", base_name="chat", site_name=None,
+                           provider=None, max_workers=DEFAULT_MAX_WORKERS, skip_existing=True):
+    """
+    Generate and save one EOD report per calendar day in the messages
+
+    Args:
+        messages: List of parsed message dictionaries (may span many days)
+        output_dir: Directory for the dated report files
+        base_name: File name prefix (usually the input file name)
+        site_name: Optional site name override
+        provider: AI provider (defaults to AI_PROVIDER env var)
+        max_workers: Maximum number of concurrent AI calls
+        skip_existing: Skip days whose report is up to date (see is_daily_report_current)
+
+    Returns:
+        Dict with 'generated' and 'skipped' lists of ISO dates and
+        'failed' mapping ISO date -> error message
+    """
+    days = group_messages_by_date(messages)
+    pending = {}
+    skipped = []
+
+    for day, day_messages in days.items():
+        if skip_existing and is_daily_report_current(output_dir, base_name, day, len(day_messages), site_name):
+            skipped.append(day)
+        else:
+            pending[day] = day_messages
+
+    print(f"📅 {len(days)} day(s) found: {len(pending)} to generate, {len(skipped)} up to date on disk")
+    os.makedirs(output_dir, exist_ok=True)
+
+    generated = []
+    failed = {}
+    for day, report, error in generate_reports_by_day(pending, site_name, provider, max_workers):
+        if error:
+            print(f"❌ {day}: {error}")
+            failed[day] = str(error)
+            continue
+
+        save_report(report, daily_report_path(output_dir, base_name, day))
+        save_daily_meta(output_dir, base_name, day, len(pending[day]), site_name)
+        generated.append(day)
+
+    return {'generated': sorted(generated), 'skipped': skipped, 'failed': failed}
@@ -0,0 +1,214 @@
+"""
+Incremental EOD Reports - Change-Only Regeneration
+
+Keeps the previous structured report and the ID of the last message it
+covered. Re-runs send only the new messages plus the prior report in a single
+"update" call, so evening re-runs cost tokens in proportion to what changed,
+and emit a section-level diff against the previous run.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+
+from .parser import group_messages_by_date
+from .structured import (
+    JSON_SCHEMA_EXAMPLE,
+    REPORT_SECTIONS,
+    generate_structured_report,
+    parse_structured_response,
+)
+from .summarizer import extract_date_from_messages, format_messages_for_ai, run_routed_prompt
+
+
+def message_id(msg):
+    """Stable ID for a parsed message (the export has no native IDs)"""
+    key = f"{msg['timestamp']}\x1f{msg['sender']}\x1f{msg['message']}"
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+
+def load_report_state(state_path):
+    """Load the saved report state, or None if there is no previous run"""
+    if not os.path.exists(state_path):
+        return None
+
+    with open(state_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_report_state(state_path, report, messages):
+    """Save the report together with the last message it covered (and its date)"""
+    state = {
+        'report': report,
+        'date': extract_date_from_messages(messages[-1:]),
+        'last_message_id': message_id(messages[-1]),
+        'message_count': len(messages),
+        'updated_at': datetime.now().isoformat(timespec='seconds'),
+    }
+    with open(state_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+
+
+def find_new_messages(messages, state):
+    """
+    Return the messages after the last one covered by the saved state
+
+    Returns:
+        List of new messages, or None if the previous last message is not in
+        this export (the report must then be regenerated from scratch)
+    """
+    last_id = state['last_message_id']
+    count = state.get('message_count', 0)
+
+    # Fast path: the export only grew since the last run
+    if 0 < count <= len(messages) and message_id(messages[count - 1]) == last_id:
+        return messages[count:]
+
+    for i in range(len(messages) - 1, -1, -1):
+        if message_id(messages[i]) == last_id:
+            return messages[i + 1:]
+    return None
+
+
+def create_update_prompt(prior_report, new_messages, site_name=None):
+    """Create the AI prompt that updates a prior structured report with new messages"""
+
+    formatted_messages = format_messages_for_ai(new_messages)
+    prior_json = json.dumps(prior_report, ensure_ascii=False, indent=2)
+    site_instruction = f'Site name: "{site_name}"' if site_name else "Keep the site name from the current report"
+
+    prompt = f"""You are updating an end-of-day (EOD) report for a construction site team. The current report below already covers earlier messages from today. New WhatsApp messages have arrived since it was written.
+
+CRITICAL RULES:
+- Return the COMPLETE updated report, not just the changes
+- Keep existing items unless the new messages change, complete or resolve them
+- Move items to "work_completed" when the new messages confirm they are done
+- Remove risks, issues or decisions that the new messages resolve
+- Add new items only from facts present in the new messages
+- Update "overall_status" only if the new messages change the picture
+- Mark a risk as "critical": true only when it needs urgent management attention
+
+{site_instruction}
+
+CURRENT REPORT:
+{prior_json}
+
+NEW WHATSAPP MESSAGES:
+{formatted_messages}
+
+Respond with ONLY a JSON object (no markdown fences, no commentary) matching EXACTLY this shape:
+{JSON_SCHEMA_EXAMPLE}
+
+Generate the updated JSON now:"""
+
+    return prompt
+
+
+def _section_entries(report, key):
+    """Section entries as comparable strings (critical risks are marked)"""
+    if key == 'risks':
+        return [f"[CRITICAL] {risk['item']}" if risk['critical'] else risk['item'] for risk in report[key]]
+    return list(report[key])
+
+
+def diff_reports(old_report, new_report):
+    """
+    Compare two structured reports section by section
+
+    Returns:
+        Dict of section key -> {'old', 'new'} for overall_status or
+        {'added', 'removed'} for list sections; unchanged sections are omitted
+    """
+    diff = {}
+    old_report = old_report or {key: ("" if key == 'overall_status' else []) for key, _, _ in REPORT_SECTIONS}
+
+    for key, _, _ in REPORT_SECTIONS:
+        if key == 'overall_status':
+            if old_report[key] != new_report[key]:
+                diff[key] = {'old': old_report[key], 'new': new_report[key]}
+            continue
+
+        old_entries = _section_entries(old_report, key)
+        new_entries = _section_entries(new_report, key)
+        added = [entry for entry in new_entries if entry not in old_entries]
+        removed = [entry for entry in old_entries if entry not in new_entries]
+        if added or removed:
+            diff[key] = {'added': added, 'removed': removed}
+
+    return diff
+
+
+def render_diff_markdown(diff):
+    """Render a section-level diff as markdown"""
+    lines = ["### Changes Since Last Run", ""]
+    if not diff:
+        lines.append("No changes.")
+        return "\n".join(lines) + "\n"
+
+    for key, heading, _ in REPORT_SECTIONS:
+        if key not in diff:
+            continue
+        lines.append(f"**{heading}**")
+        if key == 'overall_status':
+            lines.append(f"- Was: {diff[key]['old'] or '(empty)'}")
+            lines.append(f"- Now: {diff[key]['new']}")
+        else:
+            lines += [f"- ➕ {entry}" for entry in diff[key]['added']]
+            lines += [f"- ➖ {entry}" for entry in diff[key]['removed']]
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def generate_incremental_report(messages, state_path, site_name=None, provider=None, routing=None, token_budget=None):
+    """
+    Generate or update the structured EOD report, sending only new messages
+
+    The report covers the newest day in the export. It is regenerated in full
+    from that day's messages when there is no saved state, the newest message
+    is on a different day from the last covered one, or the last covered
+    message is no longer in the export.
+
+    Args:
+        messages: List of parsed message dictionaries
+        state_path: JSON file holding the previous report and message cursor
+        site_name: Optional site name override
+        provider: AI provider (defaults to AI_PROVIDER env var)
+        routing: Pick a small or large model by chat size/risk (defaults to MODEL_ROUTING env var)
+        token_budget: Optional prompt token cap for full generations
+
+    Returns:
+        Tuple of (report, diff, mode) where mode is "full", "update" or "unchanged"
+    """
+    if not messages:
+        raise ValueError("No messages to summarize")
+
+    state = load_report_state(state_path)
+    # The last covered message and the newest message must share a day;
+    # otherwise the new messages belong to another day's report
+    if state and state.get('date') != extract_date_from_messages(messages[-1:]):
+        state = None
+    new_messages = find_new_messages(messages, state) if state else None
+
+    if new_messages is None:
+        # Only the newest day, so the report date matches the saved state's date
+        latest_day, day_messages = list(group_messages_by_date(messages).items())[-1]
+        print(f"🔄 No usable previous run - generating the full report for {latest_day}")
+        report = generate_structured_report(day_messages, site_name, provider, routing, token_budget)
+        mode = "full"
+    elif not new_messages:
+        print("✅ No new messages since the last run - report unchanged")
+        return state['report'], {}, "unchanged"
+    else:
+        print(f"🔄 Updating report with {len(new_messages)} new message(s) "
+              f"(previous run covered {state['message_count']})")
+        prompt = create_update_prompt(state['report'], new_messages, site_name)
+        report = parse_structured_response(run_routed_prompt(prompt, new_messages, provider, routing))
+        report['site'] = site_name or report['site'] or state['report']['site']
+        report['date'] = state['report']['date']
+        mode = "update"
+
+    diff = diff_reports(state['report'] if state else None, report)
+    save_report_state(state_path, report, messages)
+    return report, diff, mode
@@ -1,6 +1,9 @@
+import io
+import os
 import re
 import json
 import sys
+import zipfile
 from datetime import datetime
 
 # Fix Windows console encoding issues
@@ -12,21 +15,87 @@ def clean_whatsapp_text(text):
     # Remove invisible Unicode characters used in WhatsApp mentions
     # U+2068 (FIRST STRONG ISOLATE), U+2069 (POP DIRECTIONAL ISOLATE)
     text = text.replace('\u2068', '').replace('\u2069', '')
+    # iOS exports prefix attachments and system lines with U+200E (LEFT-TO-RIGHT MARK)
+    text = text.replace('\u200e', '')
     return text.strip()
 
 
+# Media types by file extension, for the media manifest of "Export with media" zips
+MEDIA_TYPES = {
+    'image': ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.heic'),
+    'video': ('.mp4', '.mov', '.3gp', '.avi', '.mkv'),
+    'audio': ('.opus', '.ogg', '.m4a', '.mp3', '.aac', '.amr', '.wav'),
+    'document': ('.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', '.csv', '.txt', '.vcf'),
+}
+
+# Attachment references: iOS "<attached: file.jpg>" and Android "file.jpg (file attached)"
+ATTACHMENT_PATTERN = re.compile(r'<attached: ([^>]+)>|^\u200e?(.+?) \(file attached\)$', re.MULTILINE)
+
+# @mentions are wrapped in U+2068/U+2069, which clean_whatsapp_text strips
+MENTION_PATTERN = re.compile(r'@\u2068([^\u2069]+)\u2069')
+
+
 def parse_whatsapp_chat(file_path):
     """
     Parse WhatsApp exported chat TXT file.
     
+    Also accepts "Export with media" .zip files: the chat text is streamed
+    straight from the archive and attachment references are linked to the
+    media manifest (see parse_whatsapp_export).
+    
+    Args:
+        file_path: Path to the WhatsApp chat export file (.txt or .zip)
+        
+    Returns:
+        List of dictionaries with keys: timestamp, sender, message
+        (plus attachments for messages that reference media in a .zip export)
+    """
+    messages, _ = parse_whatsapp_export(file_path)
+    return messages
+
+
+def parse_whatsapp_export(file_path):
+    """
+    Parse a WhatsApp export and build its media manifest.
+    
+    For .zip exports only the chat text member is decompressed; media entries
+    are listed from the archive directory without reading their bytes.
+    
+    Args:
+        file_path: Path to the WhatsApp chat export file (.txt or .zip)
+        
+    Returns:
+        Tuple of (messages, manifest) where manifest is a list of media entries
+        (name, path, size, type) - empty for .txt exports
+    """
+    if not file_path.lower().endswith('.zip'):
+        with open(file_path, 'r', encoding='utf-8') as file:
+            return parse_chat_lines(file), []
+
+    with zipfile.ZipFile(file_path) as archive:
+        manifest = build_media_manifest(archive)
+        with archive.open(find_chat_member(archive)) as raw:
+            messages = parse_chat_lines(io.TextIOWrapper(raw, encoding='utf-8'))
+
+    link_attachments(messages, manifest)
+    return messages, manifest
+
+
+def parse_chat_lines(lines):
+    """
+    Parse WhatsApp chat lines from any iterable of text lines.
+    
     Args:
-        file_path: Path to the WhatsApp chat export file
+        lines: Iterable of lines (open file, archive stream, list of strings)
         
     Returns:
         List of dictionaries with keys: timestamp, sender, message
+        (plus mentions for messages that @mention someone)
     """
     # Regex pattern for WhatsApp message line: DD/MM/YYYY, HH:MM - Sender: Message
     message_pattern = re.compile(r'^(\d{2}/\d{2}/\d{4}, \d{2}:\d{2}) - ([^:]+): (.*)$')
+    # iOS exports (_chat.txt): [DD/MM/YYYY, HH:MM:SS] Sender: Message
+    ios_message_pattern = re.compile(r'^\[(\d{2}/\d{2}/\d{4}, \d{2}:\d{2})(?::\d{2})?\] ([^:]+): (.*)$')
     
     messages = []
     current_message = None
@@ -47,46 +116,132 @@ def parse_whatsapp_chat(file_path):
         'security code changed'
     ]
     
-    with open(file_path, 'r', encoding='utf-8') as file:
-        for line in file:
-            line = line.rstrip('\n')
+    for line in lines:
+        line = line.rstrip('\r\n')
+        
+        # Try to match a new message line (iOS lines may start with U+200E)
+        match = message_pattern.match(line) or ios_message_pattern.match(line.lstrip('\ufeff\u200e'))
+        
+        if match:
+            # Save previous message if exists
+            if current_message:
+                messages.append(current_message)
             
-            # Try to match a new message line
-            match = message_pattern.match(line)
+            # Seconds from iOS timestamps are dropped to keep DD/MM/YYYY, HH:MM
+            timestamp_str = match.group(1)
+            sender = clean_whatsapp_text(match.group(2))
+            message_text = clean_whatsapp_text(match.group(3))
             
-            if match:
-                # Save previous message if exists
-                if current_message:
-                    messages.append(current_message)
-                
-                timestamp_str = match.group(1)
-                sender = clean_whatsapp_text(match.group(2))
-                message_text = clean_whatsapp_text(match.group(3))
-                
-                # Check if this is a system message (no colon after sender or contains system indicators)
-                is_system = any(indicator in line for indicator in system_indicators)
-                
-                # Also filter messages without proper sender format (system messages)
-                if not is_system:
-                    current_message = {
-                        'timestamp': timestamp_str,
-                        'sender': sender,
-                        'message': message_text
-                    }
-                else:
-                    current_message = None
+            # Check if this is a system message (no colon after sender or contains system indicators)
+            is_system = any(indicator in line for indicator in system_indicators)
+            
+            # Also filter messages without proper sender format (system messages)
+            if not is_system:
+                current_message = {
+                    'timestamp': timestamp_str,
+                    'sender': sender,
+                    'message': message_text
+                }
+                add_mentions(current_message, match.group(3))
             else:
-                # Continuation of previous message (multi-line)
-                if current_message and line.strip():
-                    current_message['message'] += '\n' + clean_whatsapp_text(line)
-        
-        # Don't forget the last message
-        if current_message:
-            messages.append(current_message)
+                current_message = None
+        else:
+            # Continuation of previous message (multi-line)
+            if current_message and line.strip():
+                current_message['message'] += '\n' + clean_whatsapp_text(line)
+                add_mentions(current_message, line)
+    
+    # Don't forget the last message
+    if current_message:
+        messages.append(current_message)
     
     return messages
 
 
+def add_mentions(message, raw_text):
+    """Record @mentioned names from raw (uncleaned) text on a message"""
+    names = [name.strip() for name in MENTION_PATTERN.findall(raw_text)]
+    if names:
+        message.setdefault('mentions', []).extend(names)
+
+
+def parse_timestamp(timestamp_str):
+    """Convert a WhatsApp timestamp (DD/MM/YYYY, HH:MM) to a datetime"""
+    return datetime.strptime(timestamp_str, '%d/%m/%Y, %H:%M')
+
+
+def get_media_type(file_name):
+    """Classify a media file by extension (image, video, audio, document, other)"""
+    extension = os.path.splitext(file_name)[1].lower()
+    for media_type, extensions in MEDIA_TYPES.items():
+        if extension in extensions:
+            return media_type
+    return 'other'
+
+
+def find_chat_member(archive):
+    """Return the name of the chat text file inside an export zip"""
+    text_members = [name for name in archive.namelist() if name.lower().endswith('.txt')]
+    for name in text_members:
+        if os.path.basename(name) == '_chat.txt':
+            return name
+    if text_members:
+        return text_members[0]
+    raise ValueError("No chat .txt file found in zip export")
+
+
+def build_media_manifest(archive):
+    """List media entries in an export zip from its directory (no bytes are read)"""
+    chat_member = find_chat_member(archive)
+    manifest = []
+    for info in archive.infolist():
+        if info.is_dir() or info.filename == chat_member:
+            continue
+        name = os.path.basename(info.filename)
+        manifest.append({
+            'name': name,
+            'path': info.filename,
+            'size': info.file_size,
+            'type': get_media_type(name),
+        })
+    return manifest
+
+
+def link_attachments(messages, manifest):
+    """Attach manifest entries to messages that reference media files"""
+    entries = {entry['name']: entry for entry in manifest}
+    for msg in messages:
+        names = [ios or android for ios, android in ATTACHMENT_PATTERN.findall(msg['message'])]
+        if names:
+            msg['attachments'] = [
+                entries.get(name.strip()) or {
+                    'name': name.strip(), 'path': None, 'size': None, 'type': get_media_type(name.strip())
+                }
+                for name in names
+            ]
+
+
+def group_messages_by_date(messages):
+    """
+    Partition parsed messages by calendar day in a single pass.
+
+    Args:
+        messages: List of parsed message dictionaries
+
+    Returns:
+        Dict mapping ISO date (YYYY-MM-DD) to that day's messages,
+        ordered by date
+    """
+    days = {}
+    for msg in messages:
+        # Timestamp layout is fixed: DD/MM/YYYY, HH:MM
+        ts = msg['timestamp']
+        day = f"{ts[6:10]}-{ts[3:5]}-{ts[0:2]}"
+        days.setdefault(day, []).append(msg)
+
+    return {day: days[day] for day in sorted(days)}
+
+
 def save_to_json(messages, output_path):
     """Save parsed messages to JSON file"""
     with open(output_path, 'w', encoding='utf-8') as f:
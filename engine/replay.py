@@ -0,0 +1,178 @@
+"""
+Record / Replay Provider - Offline AI Responses
+
+Records real prompt/response pairs (with API keys redacted) to a JSONL fixture
+file and replays them with configurable latency, jitter and error injection.
+Prompts without a recording get a deterministic fake response, so the whole
+pipeline can be benchmarked on a machine with no API key or network.
+
+Environment Variables:
+    RECORD_FIXTURES     Path to append real responses to (recording is off when unset)
+    REPLAY_FIXTURES     Fixture file used by AI_PROVIDER=replay
+    REPLAY_LATENCY_MS   Fixed latency per call (default: the recorded latency, else 0)
+    REPLAY_JITTER_MS    Uniform +/- jitter added to the latency (default: 0)
+    REPLAY_ERROR_RATE   Fraction of calls that raise ReplayError (default: 0)
+    REPLAY_SEED         Seed for jitter and error injection (default: random)
+    REPLAY_STRICT       Set to 1 to fail on prompts with no recording instead of faking
+"""
+
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime
+
+DEFAULT_FIXTURES = "fixtures/recorded_responses.jsonl"
+
+RECORD_FIXTURES = os.getenv("RECORD_FIXTURES")
+REPLAY_FIXTURES = os.getenv("REPLAY_FIXTURES", DEFAULT_FIXTURES)
+REPLAY_LATENCY_MS = os.getenv("REPLAY_LATENCY_MS")
+REPLAY_JITTER_MS = float(os.getenv("REPLAY_JITTER_MS", "0"))
+REPLAY_ERROR_RATE = float(os.getenv("REPLAY_ERROR_RATE", "0"))
+REPLAY_SEED = os.getenv("REPLAY_SEED")
+REPLAY_STRICT = os.getenv("REPLAY_STRICT", "0") == "1"
+
+# Provider key formats (sk-ant-..., sk-or-..., sk-proj-..., sk-...)
+SECRET_PATTERN = re.compile(r'sk-[A-Za-z0-9_\-]{16,}')
+SECRET_ENV_VARS = ("ANTHROPIC_API_KEY", "OPENAI_API_KEY", "OPENROUTER_API_KEY")
+
+_lock = threading.Lock()
+_rng = random.Random(REPLAY_SEED)
+_fixture_cache = {}
+
+
+class ReplayError(RuntimeError):
+    """Raised for injected provider errors and missing recordings in strict mode"""
+
+
+def prompt_key(prompt):
+    """Stable fixture key for a prompt"""
+    return hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+
+
+def redact_secrets(text):
+    """Remove API keys from text before it is written to a fixture"""
+    for var in SECRET_ENV_VARS:
+        secret = os.getenv(var)
+        if secret:
+            text = text.replace(secret, "[REDACTED]")
+    return SECRET_PATTERN.sub("[REDACTED]", text)
+
+
+def record_completion(fixtures_path, prompt, response, provider, model, latency_ms):
+    """Append one real prompt/response pair to a JSONL fixture file"""
+    record = {
+        'key': prompt_key(prompt),
+        'provider': provider,
+        'model': model,
+        'latency_ms': round(latency_ms, 1),
+        'recorded_at': datetime.now().isoformat(timespec='seconds'),
+        'prompt': redact_secrets(prompt),
+        'response': redact_secrets(response),
+    }
+
+    with _lock:
+        if os.path.dirname(fixtures_path):
+            os.makedirs(os.path.dirname(fixtures_path), exist_ok=True)
+        with open(fixtures_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        _fixture_cache.pop(fixtures_path, None)
+
+
+def load_fixtures(fixtures_path):
+    """Load recorded responses keyed by prompt hash (cached per path)"""
+    with _lock:
+        if fixtures_path not in _fixture_cache:
+            fixtures = {}
+            if os.path.exists(fixtures_path):
+                with open(fixtures_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if line.strip():
+                            record = json.loads(line)
+                            fixtures[record['key']] = record
+            _fixture_cache[fixtures_path] = fixtures
+        return _fixture_cache[fixtures_path]
+
+
+def fake_response(prompt):
+    """Deterministic stand-in response for prompts that were never recorded"""
+    date_match = re.search(r'^Report date: (.+)$', prompt, re.MULTILINE)
+    date = date_match.group(1) if date_match else "Not specified"
+    site_match = re.search(r'^Site name: "(.+)"$', prompt, re.MULTILINE)
+    site = site_match.group(1) if site_match else "Not specified"
+    digest = prompt_key(prompt)[:8]
+
+    if "Respond with ONLY a JSON object" in prompt:
+        return json.dumps({
+            'site': site,
+            'date': date,
+            'overall_status': f"Replay placeholder report ({digest}).",
+            'work_completed': [],
+            'issues_delays': [],
+            'risks': [],
+            'tomorrow_plan': [],
+            'decisions_needed': [],
+        })
+
+    return f"""## Site: {site}
+## Date: {date}
+
+### 1. Overall Site Status
+Replay placeholder report ({digest}).
+
+### 2. Work Completed Today
+- No completed work explicitly mentioned
+
+### 3. Issues / Delays
+- None reported
+
+### 4. Risks / Attention Required
+- None identified
+
+### 5. Tomorrow's Planned Work
+- No explicit plans mentioned
+
+### 6. Decisions Needed
+- None identified
+"""
+
+
+def replay_completion(prompt, model=None, fixtures_path=None):
+    """
+    Return the recorded response for a prompt, simulating provider latency
+
+    Args:
+        prompt: Complete prompt text
+        model: Ignored (recordings are matched on prompt only)
+        fixtures_path: Fixture file (defaults to REPLAY_FIXTURES)
+
+    Returns:
+        Recorded (or deterministic fake) response text
+
+    Raises:
+        ReplayError: On injected errors, or a missing recording in strict mode
+    """
+    fixtures = load_fixtures(fixtures_path or REPLAY_FIXTURES)
+    record = fixtures.get(prompt_key(prompt))
+
+    if record is None and REPLAY_STRICT:
+        raise ReplayError(f"No recorded response for prompt {prompt_key(prompt)[:12]}")
+
+    if REPLAY_LATENCY_MS is not None:
+        latency_ms = float(REPLAY_LATENCY_MS)
+    else:
+        latency_ms = record['latency_ms'] if record else 0.0
+
+    with _lock:
+        latency_ms += _rng.uniform(-REPLAY_JITTER_MS, REPLAY_JITTER_MS)
+        inject_error = _rng.random() < REPLAY_ERROR_RATE
+
+    time.sleep(max(latency_ms, 0.0) / 1000)
+
+    if inject_error:
+        raise ReplayError("Injected provider error (replay)")
+
+    return record['response'] if record else fake_response(prompt)
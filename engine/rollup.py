@@ -0,0 +1,209 @@
+"""
+Multi-Day Rollup Reports
+
+Builds weekly or monthly reports from cached daily EOD summaries, so a rollup
+only costs one AI call per missing day plus one call per period instead of
+sending a whole month of raw chat in a single prompt.
+"""
+
+import json
+import os
+from datetime import date
+
+from .daily import DEFAULT_MAX_WORKERS, generate_reports_by_day
+from .parser import group_messages_by_date
+from .summarizer import run_prompt
+
+DEFAULT_CACHE_DIR = "output/daily"
+ROLLUP_PERIODS = ("week", "month")
+
+
+def daily_summary_path(cache_dir, day):
+    """Path of the cached summary for an ISO date (YYYY-MM-DD)"""
+    return os.path.join(cache_dir, f"{day}.json")
+
+
+def load_daily_summary(cache_dir, day):
+    """Load a cached daily summary, or None if that day has not been generated"""
+    path = daily_summary_path(cache_dir, day)
+    if not os.path.exists(path):
+        return None
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_daily_summary(cache_dir, summary):
+    """Store one day's EOD output in the cache directory"""
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(daily_summary_path(cache_dir, summary['date']), 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+
+
+def ensure_daily_summaries(messages_by_day, site_name=None, provider=None, cache_dir=DEFAULT_CACHE_DIR,
+                           max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Return a summary for every day, generating only the days that are missing.
+
+    A cached day whose message count no longer matches the export (e.g. it was
+    summarized mid-day) or that was generated for another site name is treated
+    as missing and regenerated.
+
+    Args:
+        messages_by_day: Dict of ISO date -> messages (see group_messages_by_date)
+        site_name: Optional site name override
+        provider: AI provider (defaults to AI_PROVIDER env var)
+        cache_dir: Directory holding one JSON summary per day
+        max_workers: Maximum number of concurrent AI calls for missing days
+
+    Returns:
+        Dict of ISO date -> summary dict (date, site_name, message_count, report)
+
+    Raises:
+        RuntimeError: If any day failed (after all other days have been cached)
+    """
+    summaries = {}
+    missing = {}
+
+    for day, day_messages in messages_by_day.items():
+        cached = load_daily_summary(cache_dir, day)
+        if cached and cached.get('message_count') == len(day_messages) and cached.get('site_name') == site_name:
+            summaries[day] = cached
+        else:
+            missing[day] = day_messages
+
+    if missing:
+        print(f"📅 Generating daily summaries for {len(missing)} day(s): {', '.join(missing)}")
+
+    # Keep every day that succeeded in the cache before reporting failures,
+    # so a re-run only retries the days that failed
+    failed = {}
+    for day, report, error in generate_reports_by_day(missing, site_name, provider, max_workers):
+        if error:
+            print(f"❌ {day}: {error}")
+            failed[day] = str(error)
+            continue
+
+        summary = {
+            'date': day,
+            'site_name': site_name,
+            'message_count': len(missing[day]),
+            'report': report,
+        }
+        save_daily_summary(cache_dir, summary)
+        summaries[day] = summary
+
+    generated = len(missing) - len(failed)
+    print(f"✅ Daily summaries: {len(summaries) - generated} cached, {generated} generated")
+    if failed:
+        details = "; ".join(f"{day}: {failed[day]}" for day in sorted(failed))
+        raise RuntimeError(f"Daily summaries failed for {len(failed)} day(s): {details}")
+    return {day: summaries[day] for day in sorted(summaries)}
+
+
+def get_period_label(day, period):
+    """Map an ISO date to its rollup period label (e.g. 2025-W41 or 2025-10)"""
+    d = date.fromisoformat(day)
+    if period == "week":
+        year, week, _ = d.isocalendar()
+        return f"{year}-W{week:02d}"
+    elif period == "month":
+        return d.strftime("%Y-%m")
+    raise ValueError(f"Unknown rollup period '{period}'. Use 'week' or 'month'")
+
+
+def create_rollup_prompt(period_label, summaries, site_name=None):
+    """Create the AI prompt that condenses daily summaries into one period report"""
+
+    daily_sections = []
+    for day in sorted(summaries):
+        daily_sections.append(f"=== DAILY REPORT {day} ===\n{summaries[day]['report']}")
+    daily_reports = "\n\n".join(daily_sections)
+
+    site_instruction = f'Site name: "{site_name}"' if site_name else "Extract site name from the daily reports"
+    first_day, last_day = min(summaries), max(summaries)
+
+    prompt = f"""You are consolidating daily end-of-day (EOD) reports from a construction site team into a single period report.
+
+CRITICAL RULES:
+- Only use facts present in the daily reports below
+- Merge repeated items across days instead of listing them once per day
+- Call out issues or risks that persisted across several days
+- Drop items that were resolved later in the period from the open risks/decisions
+- Use professional, executive tone
+- Keep the report to maximum 1 page when formatted
+
+{site_instruction}
+Period: {period_label} ({first_day} to {last_day}, {len(summaries)} reporting days)
+
+DAILY REPORTS:
+{daily_reports}
+
+Generate a report using EXACTLY this structure:
+
+## Site: [Extract or use provided site name]
+## Period: {period_label} ({first_day} to {last_day})
+
+### 1. Period Overview
+[One concise paragraph summarizing progress and key themes across the period]
+
+### 2. Key Work Completed
+- [Bullet points of the main deliverables completed during the period]
+
+### 3. Recurring Issues / Delays
+- [Problems and delays, noting how many days they persisted]
+
+### 4. Open Risks / Attention Required
+- **[Use bold for CRITICAL items]**
+- [If none, write "None identified"]
+
+### 5. Upcoming Work
+- [Work planned at the end of the period]
+
+### 6. Outstanding Decisions
+- [Decisions still awaiting management input]
+- [If none, write "None identified"]
+
+Generate the report now:"""
+
+    return prompt
+
+
+def generate_rollup_reports(messages, period="week", site_name=None, provider=None, cache_dir=DEFAULT_CACHE_DIR,
+                            max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Generate weekly or monthly rollup reports from parsed messages
+
+    Args:
+        messages: List of parsed message dictionaries (may span many days)
+        period: "week" or "month"
+        site_name: Optional site name override
+        provider: AI provider (defaults to AI_PROVIDER env var)
+        cache_dir: Directory for cached daily summaries
+        max_workers: Maximum number of concurrent AI calls for missing days
+
+    Returns:
+        Dict of period label -> rollup report markdown, ordered by period
+
+    Raises:
+        RuntimeError: If a daily summary or a period rollup fails
+    """
+    if period not in ROLLUP_PERIODS:
+        raise ValueError(f"Unknown rollup period '{period}'. Use 'week' or 'month'")
+
+    summaries = ensure_daily_summaries(group_messages_by_date(messages), site_name, provider, cache_dir, max_workers)
+
+    periods = {}
+    for day, summary in summaries.items():
+        periods.setdefault(get_period_label(day, period), {})[day] = summary
+
+    reports = {}
+    for label, period_summaries in periods.items():
+        print(f"🤖 Building {period} rollup {label} from {len(period_summaries)} daily summaries...")
+        prompt = create_rollup_prompt(label, period_summaries, site_name)
+        report = run_prompt(prompt, provider)
+        if report.startswith("❌ ERROR"):
+            raise RuntimeError(f"Rollup {label} failed: {report}")
+        reports[label] = report
+
+    return reports
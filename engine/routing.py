@@ -0,0 +1,140 @@
+"""
+Adaptive Model Routing
+
+Estimates prompt size and risk content locally and sends quiet days to a
+small, fast model and busy or risk-heavy days to the large configured model.
+Each routed call's latency and estimated cost are logged.
+
+Environment Variables:
+    MODEL_ROUTING            Set to 1 to route every report (default: off)
+    ROUTE_SMALL_MAX_TOKENS   Largest estimated prompt sent to the small model (default: 6000)
+    ROUTE_RISK_THRESHOLD     Risk keyword hits that force the large model (default: 3)
+    ROUTE_RISK_KEYWORDS      Comma-separated risk keywords/phrases (regex) replacing the defaults
+    ANTHROPIC_SMALL_MODEL    Small model for Anthropic (default: claude-3-5-haiku-20241022)
+    OPENAI_SMALL_MODEL       Small model for OpenAI (default: gpt-4o-mini)
+    OPENROUTER_SMALL_MODEL   Small model for OpenRouter (default: anthropic/claude-3.5-haiku)
+    ROUTING_LOG              Optional JSONL file that receives one line per routed call
+"""
+
+import json
+import os
+import re
+import threading
+from datetime import datetime
+
+MODEL_ROUTING = os.getenv("MODEL_ROUTING", "0") == "1"
+ROUTE_SMALL_MAX_TOKENS = int(os.getenv("ROUTE_SMALL_MAX_TOKENS", "6000"))
+ROUTE_RISK_THRESHOLD = int(os.getenv("ROUTE_RISK_THRESHOLD", "3"))
+ROUTING_LOG = os.getenv("ROUTING_LOG")
+
+SMALL_MODELS = {
+    "anthropic": os.getenv("ANTHROPIC_SMALL_MODEL", "claude-3-5-haiku-20241022"),
+    "openai": os.getenv("OPENAI_SMALL_MODEL", "gpt-4o-mini"),
+    "openrouter": os.getenv("OPENROUTER_SMALL_MODEL", "anthropic/claude-3.5-haiku"),
+}
+
+# USD per 1M tokens (input, output) - used for cost estimates in the log only
+MODEL_PRICES = {
+    "claude-3-5-sonnet-20241022": (3.00, 15.00),
+    "claude-3-5-haiku-20241022": (0.80, 4.00),
+    "claude-3-opus-20240229": (15.00, 75.00),
+    "claude-3-sonnet-20240229": (3.00, 15.00),
+    "claude-3-haiku-20240307": (0.25, 1.25),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4-turbo": (10.00, 30.00),
+    "gpt-4": (30.00, 60.00),
+    "gpt-3.5-turbo": (0.50, 1.50),
+    "anthropic/claude-3.5-sonnet": (3.00, 15.00),
+    "anthropic/claude-3.5-haiku": (0.80, 4.00),
+    "openai/gpt-4o": (2.50, 10.00),
+    "openai/gpt-4o-mini": (0.15, 0.60),
+}
+
+# Words that suggest a day needs the stronger model's judgement. Everyday site
+# wording ("Block A", "issued the drawings") is only matched in risk phrases.
+DEFAULT_RISK_KEYWORDS = [
+    r'delay\w*', r'urgent\w*', r'asap', r'problem\w*', r'risk\w*', r'safety', r'accident\w*',
+    r'injur\w*', r'incident\w*', r'leak\w*', r'crack\w*', r'fail\w*', r'overdue', r'penalt\w*',
+    r'escalat\w*', r'critical', r'emergenc\w*', r'damage\w*', r'defect\w*', r'stop work',
+    r'blocked by', r'blocker\w*', r'issues? with',
+]
+RISK_KEYWORDS = [
+    keyword.strip() for keyword in os.getenv("ROUTE_RISK_KEYWORDS", "").split(',') if keyword.strip()
+] or DEFAULT_RISK_KEYWORDS
+RISK_PATTERN = re.compile(r'\b(?:' + '|'.join(RISK_KEYWORDS) + r')\b', re.IGNORECASE)
+
+_log_lock = threading.Lock()
+
+
+def estimate_tokens(text):
+    """Rough token count (~4 characters per token) without a tokenizer"""
+    return len(text) // 4 + 1
+
+
+def choose_route(prompt, messages, provider, large_model):
+    """
+    Decide which model should handle a prompt
+
+    Args:
+        prompt: Complete prompt text
+        messages: Parsed messages the prompt was built from
+        provider: Resolved provider name
+        large_model: The provider's configured (large) model
+
+    Returns:
+        Dict with route ("small" or "large"), model, prompt_tokens,
+        risk_hits, message_count and reason
+    """
+    prompt_tokens = estimate_tokens(prompt)
+    risk_hits = sum(len(RISK_PATTERN.findall(msg['message'])) for msg in messages)
+    small_model = SMALL_MODELS.get(provider)
+
+    if small_model is None:
+        route, reason = "large", f"no small model configured for '{provider}'"
+    elif prompt_tokens > ROUTE_SMALL_MAX_TOKENS:
+        route, reason = "large", f"{prompt_tokens} tokens > {ROUTE_SMALL_MAX_TOKENS}"
+    elif risk_hits >= ROUTE_RISK_THRESHOLD:
+        route, reason = "large", f"{risk_hits} risk keywords >= {ROUTE_RISK_THRESHOLD}"
+    else:
+        route, reason = "small", f"{prompt_tokens} tokens, {risk_hits} risk keywords"
+
+    return {
+        'route': route,
+        'model': small_model if route == "small" else large_model,
+        'prompt_tokens': prompt_tokens,
+        'risk_hits': risk_hits,
+        'message_count': len(messages),
+        'reason': reason,
+    }
+
+
+def estimate_cost(model, prompt_tokens, completion_tokens):
+    """Estimated USD cost of one call, or None for models without a known price"""
+    prices = MODEL_PRICES.get(model)
+    if prices is None:
+        return None
+    return (prompt_tokens * prices[0] + completion_tokens * prices[1]) / 1_000_000
+
+
+def log_route(route, provider, latency_seconds, response):
+    """Print (and optionally append to ROUTING_LOG) one routed call's latency and cost"""
+    completion_tokens = estimate_tokens(response)
+    cost = estimate_cost(route['model'], route['prompt_tokens'], completion_tokens)
+    cost_text = f"~${cost:.4f}" if cost is not None else "cost n/a"
+
+    print(f"🧭 Route {route['route']} ({route['model'] or provider}): {route['reason']} | "
+          f"{latency_seconds:.2f} s, ~{route['prompt_tokens']}+{completion_tokens} tokens, {cost_text}")
+
+    if ROUTING_LOG:
+        entry = {
+            'time': datetime.now().isoformat(timespec='seconds'),
+            'provider': provider,
+            'latency_s': round(latency_seconds, 3),
+            'completion_tokens': completion_tokens,
+            'cost_usd': cost,
+            **route,
+        }
+        with _log_lock:
+            with open(ROUTING_LOG, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
@@ -0,0 +1,268 @@
+"""
+Structured EOD Reports
+
+Asks the AI provider for the six report sections as JSON, validates the
+result, and renders it locally to markdown, HTML or plain text so one AI call
+serves every output format.
+"""
+
+import html
+import json
+
+from .summarizer import format_messages_for_ai, extract_date_from_messages, run_routed_prompt
+from .threads import pack_threads
+
+# (key, heading, text used when the section is empty) in report order
+REPORT_SECTIONS = [
+    ('overall_status', "Overall Site Status", "No updates"),
+    ('work_completed', "Work Completed Today", "No completed work explicitly mentioned"),
+    ('issues_delays', "Issues / Delays", "None reported"),
+    ('risks', "Risks / Attention Required", "None identified"),
+    ('tomorrow_plan', "Tomorrow's Planned Work", "No explicit plans mentioned"),
+    ('decisions_needed', "Decisions Needed", "None identified"),
+]
+
+RENDER_FORMATS = ("markdown", "html", "text")
+
+JSON_SCHEMA_EXAMPLE = """{
+  "site": "Site name",
+  "date": "DD/MM/YYYY",
+  "overall_status": "One concise paragraph summarizing the day",
+  "work_completed": ["Completed task or deliverable"],
+  "issues_delays": ["Problem, blocker or delay"],
+  "risks": [{"item": "Risk or item needing attention", "critical": true}],
+  "tomorrow_plan": ["Scheduled work, meeting or activity"],
+  "decisions_needed": ["Decision awaiting management input"]
+}"""
+
+
+def create_structured_prompt(messages, site_name=None, date=None):
+    """Create the AI prompt asking for the EOD report as JSON (see create_eod_prompt for date)"""
+
+    date = date or extract_date_from_messages(messages)
+    formatted_messages = format_messages_for_ai(messages)
+
+    site_instruction = f'Site name: "{site_name}"' if site_name else "Extract site name from context (if mentioned)"
+
+    prompt = f"""You are analyzing WhatsApp messages from a construction site team. Your task is to generate a professional end-of-day (EOD) report as JSON.
+
+CRITICAL RULES:
+- Do NOT invent facts or information not present in the messages
+- Use an empty list for any section with no relevant information
+- Group similar updates together logically
+- Highlight delays and risks with clear, direct language
+- Use professional, executive tone
+- Mark a risk as "critical": true only when it needs urgent management attention
+- Only include messages in the last 24 hours
+
+{site_instruction}
+Report date: {date}
+
+WHATSAPP MESSAGES:
+{formatted_messages}
+
+Respond with ONLY a JSON object (no markdown fences, no commentary) matching EXACTLY this shape:
+{JSON_SCHEMA_EXAMPLE}
+
+Generate the JSON now:"""
+
+    return prompt
+
+
+def validate_structured_report(data):
+    """
+    Validate and normalize a structured report dictionary
+
+    Plain-string risks are accepted and converted to non-critical risk items.
+
+    Returns:
+        Normalized report dictionary
+
+    Raises:
+        ValueError: If required fields are missing or have the wrong type
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Structured report must be a JSON object")
+
+    errors = []
+    report = {
+        'site': data.get('site') or "",
+        'date': data.get('date') or "",
+    }
+    for key in ('site', 'date'):
+        if not isinstance(report[key], str):
+            errors.append(f"'{key}' must be a string")
+
+    overall_status = data.get('overall_status')
+    if not isinstance(overall_status, str):
+        errors.append("'overall_status' must be a string")
+    report['overall_status'] = overall_status
+
+    for key, _, _ in REPORT_SECTIONS[1:]:
+        items = data.get(key, [])
+        if not isinstance(items, list):
+            errors.append(f"'{key}' must be a list")
+            continue
+
+        if key == 'risks':
+            risks = []
+            for item in items:
+                if isinstance(item, str):
+                    risks.append({'item': item, 'critical': False})
+                elif (isinstance(item, dict) and isinstance(item.get('item'), str)
+                      and isinstance(item.get('critical', False), bool)):
+                    risks.append({'item': item['item'], 'critical': item.get('critical', False)})
+                else:
+                    errors.append("'risks' entries must be strings or {\"item\", \"critical\": true/false} objects")
+                    break
+            report[key] = risks
+        else:
+            if not all(isinstance(item, str) for item in items):
+                errors.append(f"'{key}' entries must be strings")
+            report[key] = items
+
+    if errors:
+        raise ValueError("Invalid structured report: " + "; ".join(errors))
+
+    return report
+
+
+def parse_structured_response(text):
+    """Extract and validate the JSON report from a raw model response"""
+    start = text.find('{')
+    end = text.rfind('}')
+    if start == -1 or end < start:
+        raise ValueError("No JSON object found in model response")
+
+    try:
+        data = json.loads(text[start:end + 1])
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Model response is not valid JSON: {e}")
+
+    return validate_structured_report(data)
+
+
+def generate_structured_report(messages, site_name=None, provider=None, routing=None, token_budget=None):
+    """
+    Generate a structured EOD report from parsed messages
+
+    Args:
+        messages: List of parsed message dictionaries
+        site_name: Optional site name override
+        provider: "anthropic", "openai", "openrouter", or "replay" (defaults to AI_PROVIDER env var)
+        routing: Pick a small or large model by chat size/risk (defaults to MODEL_ROUTING env var)
+        token_budget: Optional cap on message tokens in the prompt (whole threads only)
+
+    Returns:
+        Validated report dictionary (see REPORT_SECTIONS)
+    """
+    if not messages:
+        raise ValueError("No messages to summarize")
+
+    # Date the report from the whole export; route on the messages that reach the prompt
+    date = extract_date_from_messages(messages)
+    if token_budget:
+        messages = pack_threads(messages, token_budget)
+        if not messages:
+            raise ValueError(f"No whole conversation thread fits the token budget ({token_budget})")
+
+    prompt = create_structured_prompt(messages, site_name, date)
+    report = parse_structured_response(run_routed_prompt(prompt, messages, provider, routing))
+
+    # Fall back to known values when the model leaves them blank
+    report['site'] = site_name or report['site'] or "Not specified"
+    report['date'] = report['date'] or date
+    return report
+
+
+def _section_items(report, key):
+    """Return a section's entries as (text, critical) pairs"""
+    if key == 'risks':
+        return [(risk['item'], risk['critical']) for risk in report[key]]
+    return [(item, False) for item in report[key]]
+
+
+def render_markdown(report):
+    """Render a structured report in the standard EOD markdown layout"""
+    lines = [f"## Site: {report['site']}", f"## Date: {report['date']}", ""]
+
+    for number, (key, heading, empty_text) in enumerate(REPORT_SECTIONS, 1):
+        lines.append(f"### {number}. {heading}")
+        if key == 'overall_status':
+            lines.append(report[key] or empty_text)
+        else:
+            items = _section_items(report, key)
+            if not items:
+                lines.append(f"- {empty_text}")
+            for text, critical in items:
+                lines.append(f"- **{text}**" if critical else f"- {text}")
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def render_html(report):
+    """Render a structured report as a standalone HTML fragment"""
+    parts = [
+        f"<h2>Site: {html.escape(report['site'])}</h2>",
+        f"<h2>Date: {html.escape(report['date'])}</h2>",
+    ]
+
+    for number, (key, heading, empty_text) in enumerate(REPORT_SECTIONS, 1):
+        parts.append(f"<h3>{number}. {html.escape(heading)}</h3>")
+        if key == 'overall_status':
+            parts.append(f"<p>{html.escape(report[key] or empty_text)}</p>")
+            continue
+
+        items = _section_items(report, key) or [(empty_text, False)]
+        parts.append("<ul>")
+        for text, critical in items:
+            text = html.escape(text)
+            parts.append(f"  <li><strong>{text}</strong></li>" if critical else f"  <li>{text}</li>")
+        parts.append("</ul>")
+
+    return "\n".join(parts) + "\n"
+
+
+def render_text(report):
+    """Render a structured report as plain text (e.g. for WhatsApp or email)"""
+    lines = [f"SITE: {report['site']}", f"DATE: {report['date']}", ""]
+
+    for number, (key, heading, empty_text) in enumerate(REPORT_SECTIONS, 1):
+        lines.append(f"{number}. {heading.upper()}")
+        if key == 'overall_status':
+            lines.append(report[key] or empty_text)
+        else:
+            items = _section_items(report, key)
+            if not items:
+                lines.append(f"  - {empty_text}")
+            for text, critical in items:
+                lines.append(f"  - [CRITICAL] {text}" if critical else f"  - {text}")
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def render_report(report, fmt="markdown"):
+    """Render a structured report to "markdown", "html" or "text" """
+    if fmt == "markdown":
+        return render_markdown(report)
+    elif fmt == "html":
+        return render_html(report)
+    elif fmt == "text":
+        return render_text(report)
+    raise ValueError(f"Unknown report format '{fmt}'. Use 'markdown', 'html', or 'text'")
+
+
+def save_structured_report(report, output_path):
+    """Save a structured report to a JSON file"""
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"✅ Structured report saved to: {output_path}")
+
+
+def load_structured_report(input_path):
+    """Load and validate a structured report saved by save_structured_report"""
+    with open(input_path, 'r', encoding='utf-8') as f:
+        report = validate_structured_report(json.load(f))
+    return report
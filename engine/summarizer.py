@@ -7,6 +7,7 @@ Converts parsed WhatsApp messages into structured end-of-day construction site r
 import json
 import os
 import sys
+import time
 from datetime import datetime
 from .parser import parse_whatsapp_chat
 
@@ -18,9 +19,14 @@ except ImportError:
     # python-dotenv not installed, will use system environment variables
     pass
 
+# Imported after .env is loaded so REPLAY_*, RECORD_FIXTURES and routing settings apply
+from .replay import RECORD_FIXTURES, record_completion, replay_completion
+from .routing import MODEL_ROUTING, choose_route, log_route
+from .threads import pack_threads
+
 
 # AI Provider Configuration
-AI_PROVIDER = os.getenv("AI_PROVIDER", "anthropic")  # "anthropic", "openai", or "openrouter"
+AI_PROVIDER = os.getenv("AI_PROVIDER", "anthropic")  # "anthropic", "openai", "openrouter", or "replay"
 
 # Model Configuration (with sensible defaults)
 DEFAULT_ANTHROPIC_MODEL = "claude-3-5-sonnet-20241022"
@@ -61,11 +67,16 @@ def extract_date_from_messages(messages):
     return date_part
 
 
-def create_eod_prompt(messages, site_name=None):
-    """Create the AI prompt for EOD report generation"""
+def create_eod_prompt(messages, site_name=None, date=None):
+    """
+    Create the AI prompt for EOD report generation
     
+    Pass date when messages is a subset of the export (e.g. packed threads),
+    so the report is dated from the full message list.
+    """
+    
+    date = date or extract_date_from_messages(messages)
     formatted_messages = format_messages_for_ai(messages)
-    date = extract_date_from_messages(messages)
     
     site_instruction = f'Site name: "{site_name}"' if site_name else "Extract site name from context (if mentioned)"
     
@@ -122,7 +133,7 @@ Generate the report now:"""
     return prompt
 
 
-def summarize_with_anthropic(messages, site_name=None, model=None):
+def summarize_with_anthropic(messages, site_name=None, model=None, prompt=None):
     """Generate EOD report using Anthropic Claude API"""
     model = model or ANTHROPIC_MODEL
     try:
@@ -138,7 +149,7 @@ def summarize_with_anthropic(messages, site_name=None, model=None):
         sys.exit(1)
     
     client = anthropic.Anthropic(api_key=API_KEY)
-    prompt = create_eod_prompt(messages, site_name)
+    prompt = prompt or create_eod_prompt(messages, site_name)
     
     print("🤖 Generating EOD report with Claude...")
     
@@ -153,7 +164,7 @@ def summarize_with_anthropic(messages, site_name=None, model=None):
     return message.content[0].text
 
 
-def summarize_with_openai(messages, site_name=None, model=None):
+def summarize_with_openai(messages, site_name=None, model=None, prompt=None):
     """Generate EOD report using OpenAI API"""
     model = model or OPENAI_MODEL
     try:
@@ -169,7 +180,7 @@ def summarize_with_openai(messages, site_name=None, model=None):
         sys.exit(1)
     
     client = OpenAI(api_key=API_KEY)
-    prompt = create_eod_prompt(messages, site_name)
+    prompt = prompt or create_eod_prompt(messages, site_name)
     
     print("🤖 Generating EOD report with GPT-4...")
     
@@ -186,7 +197,7 @@ def summarize_with_openai(messages, site_name=None, model=None):
     return response.choices[0].message.content
 
 
-def summarize_with_openrouter(messages, site_name=None, model=None):
+def summarize_with_openrouter(messages, site_name=None, model=None, prompt=None):
     """Generate EOD report using OpenRouter API"""
     model = model or OPENROUTER_MODEL
     try:
@@ -207,7 +218,7 @@ def summarize_with_openrouter(messages, site_name=None, model=None):
         base_url="https://openrouter.ai/api/v1",
         api_key=API_KEY
     )
-    prompt = create_eod_prompt(messages, site_name)
+    prompt = prompt or create_eod_prompt(messages, site_name)
     
     print(f"🤖 Generating EOD report with OpenRouter ({model})...")
     
@@ -224,31 +235,98 @@ def summarize_with_openrouter(messages, site_name=None, model=None):
     return response.choices[0].message.content
 
 
-def generate_eod_report(messages, site_name=None, provider=None):
+def generate_eod_report(messages, site_name=None, provider=None, routing=None, token_budget=None):
     """
     Generate EOD report from parsed messages
     
     Args:
         messages: List of parsed message dictionaries
         site_name: Optional site name override
-        provider: "anthropic", "openai", or "openrouter" (defaults to AI_PROVIDER env var)
+        provider: "anthropic", "openai", "openrouter", or "replay" (defaults to AI_PROVIDER env var)
+        routing: Pick a small or large model by chat size/risk (defaults to MODEL_ROUTING env var)
+        token_budget: Optional cap on message tokens in the prompt (whole threads only)
     
     Returns:
         Formatted EOD report as markdown string
     """
     if not messages:
         return "❌ ERROR: No messages to summarize"
-    
+
+    # Date the report from the whole export; route on the messages that reach the prompt
+    date = extract_date_from_messages(messages)
+    if token_budget:
+        messages = pack_threads(messages, token_budget)
+        if not messages:
+            return f"❌ ERROR: No whole conversation thread fits the token budget ({token_budget})"
+
+    return run_routed_prompt(create_eod_prompt(messages, site_name, date), messages, provider, routing)
+
+
+def get_default_model(provider):
+    """Return the configured model for a provider (None if it has none)"""
+    return {
+        "anthropic": ANTHROPIC_MODEL,
+        "openai": OPENAI_MODEL,
+        "openrouter": OPENROUTER_MODEL,
+    }.get(provider)
+
+
+def run_routed_prompt(prompt, messages, provider=None, routing=None):
+    """
+    Send a prompt to the model chosen by the routing policy (see engine/routing.py)
+
+    Without routing this is the same as run_prompt with the configured model.
+    """
+    routing = MODEL_ROUTING if routing is None else routing
+    if not routing:
+        return run_prompt(prompt, provider)
+
     provider = provider or AI_PROVIDER
-    
+    route = choose_route(prompt, messages, provider, get_default_model(provider))
+
+    start = time.perf_counter()
+    response = run_prompt(prompt, provider, route['model'])
+    log_route(route, provider, time.perf_counter() - start, response)
+    return response
+
+
+def run_prompt(prompt, provider=None, model=None):
+    """
+    Send a prebuilt prompt to the configured AI provider
+
+    Args:
+        prompt: Complete prompt text
+        provider: "anthropic", "openai", "openrouter", or "replay" (defaults to AI_PROVIDER env var)
+        model: Optional model override (defaults to the provider's configured model)
+
+    Returns:
+        Raw text response from the model
+    """
+    provider = provider or AI_PROVIDER
+
+    if provider == "replay":
+        # Offline fixtures - see engine/replay.py
+        return replay_completion(prompt, model)
+
     if provider == "anthropic":
-        return summarize_with_anthropic(messages, site_name)
+        summarize = summarize_with_anthropic
     elif provider == "openai":
-        return summarize_with_openai(messages, site_name)
+        summarize = summarize_with_openai
     elif provider == "openrouter":
-        return summarize_with_openrouter(messages, site_name)
+        summarize = summarize_with_openrouter
     else:
-        return f"❌ ERROR: Unknown AI provider '{provider}'. Use 'anthropic', 'openai', or 'openrouter'"
+        return f"❌ ERROR: Unknown AI provider '{provider}'. Use 'anthropic', 'openai', 'openrouter', or 'replay'"
+
+    model = model or get_default_model(provider)
+
+    start = time.perf_counter()
+    response = summarize(None, model=model, prompt=prompt)
+
+    # Record real responses for offline replay when RECORD_FIXTURES is set
+    if RECORD_FIXTURES:
+        record_completion(RECORD_FIXTURES, prompt, response, provider, model, (time.perf_counter() - start) * 1000)
+
+    return response
 
 
 def save_report(report, output_path):
@@ -267,7 +345,7 @@ def main():
         print('  python summarizer.py "output/parsed_messages.json" "Site A Construction"')
         print('  python summarizer.py "output/parsed_messages.json" "Site A" "reports/eod_report.md"')
         print("\nEnvironment Variables:")
-        print("  AI_PROVIDER=anthropic, openai, or openrouter (default: anthropic)")
+        print("  AI_PROVIDER=anthropic, openai, openrouter, or replay (default: anthropic)")
         print("  ANTHROPIC_API_KEY=your-api-key")
         print("  OPENAI_API_KEY=your-api-key")
         print("  OPENROUTER_API_KEY=your-api-key")
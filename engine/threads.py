@@ -0,0 +1,192 @@
+"""
+Conversation Threads - Reply Reconstruction
+
+format_messages_for_ai flattens the chat into one list, so trimming or
+chunking it can cut a question off from its answer. This module rebuilds a
+thread index locally from @mentions, quoted text and time-gap heuristics, and
+packs whole threads into a token budget for chunkers and the prompt builder.
+"""
+
+from .parser import parse_timestamp
+from .routing import estimate_tokens
+
+# A message within this many minutes of the previous one continues the conversation
+QUICK_REPLY_MINUTES = 5
+
+# Longest run of one sender's follow-ups chained by time alone (caps monologues)
+MAX_CONTINUATION_MESSAGES = 10
+
+# An @mention links to the mentioned person's messages within this window
+MENTION_WINDOW_MINUTES = 24 * 60
+
+# Minimum quoted length to match against earlier messages
+QUOTE_MIN_CHARS = 12
+
+
+def _quoted_text(message_text):
+    """Return the text of "> quoted" lines in a message, if any"""
+    quoted = [line.lstrip('> ').strip() for line in message_text.split('\n') if line.startswith('>')]
+    return " ".join(quoted)
+
+
+def build_thread_index(messages, quick_reply_minutes=QUICK_REPLY_MINUTES,
+                       mention_window_minutes=MENTION_WINDOW_MINUTES):
+    """
+    Link each message to the message it most likely replies to
+
+    Links are tried in order of strength:
+      1. Quoted text ("> ...") matching an earlier message
+      2. @mention of someone -> their latest message within the window
+      3. Sender was @mentioned recently -> the message that mentioned them
+      4. Quick reply or same-sender follow-up -> the previous message
+         (at most MAX_CONTINUATION_MESSAGES follow-ups in a row)
+
+    Args:
+        messages: List of parsed message dictionaries (chronological order)
+        quick_reply_minutes: Max gap for the time-based link
+        mention_window_minutes: Max gap for mention-based links
+
+    Returns:
+        Dict with 'parents' (parent index or None per message) and
+        'threads' (lists of message indices, ordered by first message)
+    """
+    times = [parse_timestamp(msg['timestamp']) for msg in messages]
+    parents = [None] * len(messages)
+    continuations = [0] * len(messages)
+    last_by_sender = {}
+    last_mention_of = {}
+
+    def within(i, j, minutes):
+        return 0 <= (times[i] - times[j]).total_seconds() / 60 <= minutes
+
+    for i, msg in enumerate(messages):
+        parent = None
+
+        quoted = _quoted_text(msg['message'])
+        if len(quoted) >= QUOTE_MIN_CHARS:
+            snippet = quoted[:60]
+            for j in range(i - 1, -1, -1):
+                if snippet in messages[j]['message']:
+                    parent = j
+                    break
+
+        if parent is None:
+            for name in msg.get('mentions', []):
+                j = last_by_sender.get(name)
+                if j is not None and within(i, j, mention_window_minutes):
+                    parent = j if parent is None else max(parent, j)
+
+        if parent is None:
+            j = last_mention_of.get(msg['sender'])
+            if j is not None and within(i, j, mention_window_minutes):
+                parent = j
+                # Only the first reply answers the mention; later ones use time gaps
+                del last_mention_of[msg['sender']]
+
+        if parent is None and i > 0 and within(i, i - 1, quick_reply_minutes):
+            if msg['sender'] != messages[i - 1]['sender']:
+                parent = i - 1
+            elif continuations[i - 1] < MAX_CONTINUATION_MESSAGES:
+                parent = i - 1
+                continuations[i] = continuations[i - 1] + 1
+
+        parents[i] = parent
+        last_by_sender[msg['sender']] = i
+        for name in msg.get('mentions', []):
+            last_mention_of[name] = i
+
+    # Group into threads by following parent links to the root
+    roots = []
+    for i, parent in enumerate(parents):
+        roots.append(i if parent is None else roots[parent])
+
+    threads = {}
+    for i, root in enumerate(roots):
+        threads.setdefault(root, []).append(i)
+
+    return {'parents': parents, 'threads': [threads[root] for root in sorted(threads)]}
+
+
+def get_conversation_segments(messages, thread_index=None):
+    """
+    Return each thread as a segment with its messages and metadata
+
+    Returns:
+        List of dicts with thread_id, start, end, participants, messages
+    """
+    thread_index = thread_index or build_thread_index(messages)
+    segments = []
+    for thread_id, indices in enumerate(thread_index['threads']):
+        thread_messages = [messages[i] for i in indices]
+        segments.append({
+            'thread_id': thread_id,
+            'start': thread_messages[0]['timestamp'],
+            'end': thread_messages[-1]['timestamp'],
+            'participants': sorted({msg['sender'] for msg in thread_messages}),
+            'messages': thread_messages,
+        })
+    return segments
+
+
+def _thread_tokens(messages, indices):
+    """Estimated prompt tokens for a thread, formatted like format_messages_for_ai"""
+    return sum(
+        estimate_tokens(f"[{messages[i]['timestamp']}] {messages[i]['sender']}: {messages[i]['message']}\n")
+        for i in indices
+    )
+
+
+def pack_threads(messages, token_budget, thread_index=None):
+    """
+    Select whole threads that fit in a token budget, newest first
+
+    Threads that do not fit are skipped whole, so a question is never kept
+    without its answer.
+
+    Args:
+        messages: List of parsed message dictionaries
+        token_budget: Maximum estimated tokens for the selected messages
+        thread_index: Optional precomputed build_thread_index result
+
+    Returns:
+        Selected messages in chronological order
+    """
+    thread_index = thread_index or build_thread_index(messages)
+    selected = []
+    used = 0
+
+    for indices in reversed(thread_index['threads']):
+        tokens = _thread_tokens(messages, indices)
+        if used + tokens <= token_budget:
+            selected.extend(indices)
+            used += tokens
+
+    return [messages[i] for i in sorted(selected)]
+
+
+def chunk_threads(messages, token_budget, thread_index=None):
+    """
+    Split messages into chunks of whole threads, each within a token budget
+
+    A single thread larger than the budget becomes its own chunk.
+
+    Returns:
+        List of message lists in chronological order
+    """
+    thread_index = thread_index or build_thread_index(messages)
+    chunks = []
+    current = []
+    used = 0
+
+    for indices in thread_index['threads']:
+        tokens = _thread_tokens(messages, indices)
+        if current and used + tokens > token_budget:
+            chunks.append(sorted(current))
+            current, used = [], 0
+        current.extend(indices)
+        used += tokens
+
+    if current:
+        chunks.append(sorted(current))
+
+    return [[messages[i] for i in chunk] for chunk in chunks]
@@ -0,0 +1,90 @@
+"""
+Per-Day EOD Report Backfill
+
+Splits one multi-day WhatsApp export into calendar days and generates one
+dated EOD report per day concurrently. Days whose report on disk covers the
+same messages are skipped, so the command can be re-run safely.
+
+Usage:
+    python backfill_reports.py <input_file> [site_name] [--workers=N] [--force]
+
+Example:
+    python backfill_reports.py "input/chat.txt" "Site A" --workers=8
+"""
+
+import sys
+import os
+
+# Add parent directory to path to import from engine
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from engine.parser import parse_whatsapp_chat
+from engine.daily import DEFAULT_MAX_WORKERS, generate_daily_reports
+
+
+def main():
+    flags = [arg for arg in sys.argv[1:] if arg.startswith('--')]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+
+    if len(args) < 1:
+        print("Usage: python backfill_reports.py <input_file> [site_name] [--workers=N] [--force]")
+        print("\nExamples:")
+        print('  python backfill_reports.py "input/team-chat.txt"')
+        print('  python backfill_reports.py "input/team-chat.txt" "Site A" --workers=8')
+        print("\nOptions:")
+        print(f"  --workers=N  Maximum concurrent AI calls (default: {DEFAULT_MAX_WORKERS})")
+        print("  --force      Regenerate every day, even days whose report is up to date")
+        print("\nOutput:")
+        print("  - output/<filename>_<YYYY-MM-DD>_eod_report.md (one per day)")
+        print("  - output/<filename>_<YYYY-MM-DD>_eod_meta.json (message count, used to skip up-to-date days)")
+        sys.exit(1)
+
+    input_file = args[0]
+    site_name = args[1] if len(args) >= 2 else None
+    force = '--force' in flags
+    max_workers = DEFAULT_MAX_WORKERS
+    for flag in flags:
+        if flag.startswith('--workers='):
+            max_workers = int(flag.split('=', 1)[1])
+
+    # Check if file exists
+    if not os.path.exists(input_file):
+        print(f"❌ ERROR: File not found: {input_file}")
+        sys.exit(1)
+
+    base_name = os.path.splitext(os.path.basename(input_file))[0]
+
+    try:
+        print(f"📱 Parsing: {input_file}")
+        messages = parse_whatsapp_chat(input_file)
+        print(f"✅ Parsed {len(messages)} messages")
+        print()
+
+        result = generate_daily_reports(
+            messages,
+            output_dir="output",
+            base_name=base_name,
+            site_name=site_name,
+            max_workers=max_workers,
+            skip_existing=not force,
+        )
+
+        print("\n" + "=" * 70)
+        print(f"✅ Generated: {len(result['generated'])}  ⏭️  Skipped: {len(result['skipped'])}  "
+              f"❌ Failed: {len(result['failed'])}")
+        print("=" * 70)
+        for day, error in sorted(result['failed'].items()):
+            print(f"❌ {day}: {error}")
+
+        if result['failed']:
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
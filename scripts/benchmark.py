@@ -0,0 +1,101 @@
+"""
+End-to-End Pipeline Benchmark
+
+Runs the full parse + summarize pipeline concurrently and reports throughput
+and latency. Uses the offline replay provider by default, so it needs no API
+key or network (see engine/replay.py for REPLAY_* latency/error settings).
+
+Usage:
+    python benchmark.py <input_file> [runs] [workers] [--structured] [--live]
+
+Example:
+    REPLAY_LATENCY_MS=1500 REPLAY_JITTER_MS=500 python benchmark.py "input/chat.txt" 50 8
+"""
+
+import math
+import sys
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path to import from engine
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from engine.parser import parse_whatsapp_chat
+from engine.summarizer import generate_eod_report
+from engine.structured import generate_structured_report
+
+
+def run_pipeline(input_file, provider, structured):
+    """Parse and summarize once, returning (latency_seconds, error)"""
+    start = time.perf_counter()
+    try:
+        messages = parse_whatsapp_chat(input_file)
+        if structured:
+            generate_structured_report(messages, provider=provider)
+        else:
+            generate_eod_report(messages, provider=provider)
+        return time.perf_counter() - start, None
+    except Exception as e:
+        return time.perf_counter() - start, e
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    index = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def main():
+    flags = [arg for arg in sys.argv[1:] if arg.startswith('--')]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+
+    if len(args) < 1:
+        print("Usage: python benchmark.py <input_file> [runs] [workers] [--structured] [--live]")
+        print("\nExamples:")
+        print('  python benchmark.py "input/team-chat.txt"')
+        print('  python benchmark.py "input/team-chat.txt" 50 8 --structured')
+        print("\nOptions:")
+        print("  --structured  Benchmark the JSON report mode")
+        print("  --live        Use AI_PROVIDER instead of the offline replay provider")
+        print("\nReplay settings: REPLAY_FIXTURES, REPLAY_LATENCY_MS, REPLAY_JITTER_MS,")
+        print("                 REPLAY_ERROR_RATE, REPLAY_SEED")
+        sys.exit(1)
+
+    input_file = args[0]
+    runs = int(args[1]) if len(args) >= 2 else 20
+    workers = int(args[2]) if len(args) >= 3 else 4
+    provider = None if '--live' in flags else "replay"
+    structured = '--structured' in flags
+
+    if not os.path.exists(input_file):
+        print(f"❌ ERROR: File not found: {input_file}")
+        sys.exit(1)
+
+    print(f"⏱️  Benchmarking {runs} runs with {workers} workers ({provider or 'live provider'})")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(lambda _: run_pipeline(input_file, provider, structured), range(runs)))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for latency, error in results if error is None)
+    errors = [error for _, error in results if error is not None]
+
+    print("\n" + "=" * 60)
+    print("BENCHMARK RESULTS")
+    print("=" * 60)
+    print(f"Runs:        {runs} ({len(errors)} errors)")
+    print(f"Wall time:   {elapsed:.2f} s")
+    print(f"Throughput:  {runs / elapsed:.2f} reports/s")
+    if latencies:
+        print(f"Latency p50: {percentile(latencies, 50):.3f} s")
+        print(f"Latency p95: {percentile(latencies, 95):.3f} s")
+        print(f"Latency max: {latencies[-1]:.3f} s")
+    if errors:
+        print(f"First error: {errors[0]}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -92,9 +92,18 @@ def check_env_variables():
             print("  Get your key at: https://openrouter.ai/keys")
             return False
     
+    elif ai_provider == "replay":
+        fixtures = os.getenv("REPLAY_FIXTURES", "fixtures/recorded_responses.jsonl")
+        print("✅ Offline replay provider (no API key needed)")
+        if os.path.exists(fixtures):
+            print(f"✅ REPLAY_FIXTURES: {fixtures}")
+        else:
+            print(f"⚠️  REPLAY_FIXTURES not found: {fixtures} (deterministic fake responses will be used)")
+        return True
+    
     else:
         print(f"❌ Unknown AI_PROVIDER: {ai_provider}")
-        print("   Valid options: 'anthropic', 'openai', or 'openrouter'")
+        print("   Valid options: 'anthropic', 'openai', 'openrouter', or 'replay'")
         return False
 
 
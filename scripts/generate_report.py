@@ -2,7 +2,7 @@
 Complete End-to-End EOD Report Generator
 
 This script combines parsing and summarization into one command.
-Usage: python generate_report.py "input/chat.txt" [site_name]
+Usage: python generate_report.py "input/chat.txt" [site_name] [--structured] [--incremental] [--analytics] [--token-budget=N]
 """
 
 import sys
@@ -13,17 +13,36 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from engine.parser import parse_whatsapp_chat, save_to_json, validate_messages
 from engine.summarizer import generate_eod_report, save_report
+from engine.structured import generate_structured_report, render_markdown, save_structured_report
+from engine.analytics import compute_chat_analytics, render_analytics_appendix
+from engine.incremental import generate_incremental_report, render_diff_markdown
 
 
 def main():
-    if len(sys.argv) < 2:
+    flags = [arg for arg in sys.argv[1:] if arg.startswith('--')]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    incremental = '--incremental' in flags
+    structured = '--structured' in flags or incremental
+    analytics = '--analytics' in flags
+    token_budget = None
+    for flag in flags:
+        if flag.startswith('--token-budget='):
+            token_budget = int(flag.split('=', 1)[1])
+
+    if len(args) < 1:
         print("=" * 70)
         print("WhatsApp EOD Report Generator - Complete Pipeline")
         print("=" * 70)
-        print("\nUsage: python generate_report.py <input_file> [site_name]")
+        print("\nUsage: python generate_report.py <input_file> [site_name] [--structured] [--incremental] [--analytics] [--token-budget=N]")
         print("\nExamples:")
         print('  python generate_report.py "input/team-chat.txt"')
         print('  python generate_report.py "input/team-chat.txt" "Site A Construction"')
+        print('  python generate_report.py "input/team-chat.txt" "Site A" --structured')
+        print("\nOptions:")
+        print("  --structured  Request JSON sections and save them next to the markdown")
+        print("  --incremental Re-runs only send new messages + the previous report (implies --structured)")
+        print("  --analytics   Append local sender/hour activity stats (no AI tokens)")
+        print("  --token-budget=N  Keep only whole conversation threads within ~N tokens (newest first)")
         print("\nEnvironment Variables Required:")
         print("  AI_PROVIDER=anthropic or openai")
         print("  ANTHROPIC_API_KEY=your-key (if using Claude)")
@@ -31,11 +50,13 @@ def main():
         print("\nOutput:")
         print("  - Parsed JSON: output/<filename>_parsed.json")
         print("  - EOD Report: output/<filename>_eod_report.md")
+        print("  - Structured: output/<filename>_eod_report.json (with --structured)")
+        print("  - Changes: output/<filename>_eod_changes.md (with --incremental)")
         print("=" * 70)
         sys.exit(1)
     
-    input_file = sys.argv[1]
-    site_name = sys.argv[2] if len(sys.argv) >= 3 else None
+    input_file = args[0]
+    site_name = args[1] if len(args) >= 2 else None
     
     # Check if file exists
     if not os.path.exists(input_file):
@@ -46,6 +67,9 @@ def main():
     base_name = os.path.splitext(os.path.basename(input_file))[0]
     json_output = f"output/{base_name}_parsed.json"
     report_output = f"output/{base_name}_eod_report.md"
+    structured_output = f"output/{base_name}_eod_report.json"
+    state_output = f"output/{base_name}_eod_state.json"
+    changes_output = f"output/{base_name}_eod_changes.md"
     
     # Ensure output directory exists
     os.makedirs("output", exist_ok=True)
@@ -66,6 +90,9 @@ def main():
         # Save parsed JSON
         save_to_json(messages, json_output)
         
+        # Local stats first, so a missing numpy stops the run before the paid AI call
+        chat_stats = compute_chat_analytics(messages) if analytics else None
+        
         print("\n" + "=" * 70)
         print("STEP 2: GENERATING EOD REPORT")
         print("=" * 70)
@@ -77,7 +104,23 @@ def main():
             print(f"📍 Site: {site_name}")
         print()
         
-        report = generate_eod_report(messages, site_name)
+        changes = None
+        if incremental:
+            structured_report, diff, mode = generate_incremental_report(
+                messages, state_output, site_name, token_budget=token_budget
+            )
+            save_structured_report(structured_report, structured_output)
+            report = render_markdown(structured_report)
+            changes = render_diff_markdown(diff)
+        elif structured:
+            structured_report = generate_structured_report(messages, site_name, token_budget=token_budget)
+            save_structured_report(structured_report, structured_output)
+            report = render_markdown(structured_report)
+        else:
+            report = generate_eod_report(messages, site_name, token_budget=token_budget)
+
+        if chat_stats is not None:
+            report += "\n" + render_analytics_appendix(chat_stats)
         
         # Display report
         print("\n" + "=" * 70)
@@ -88,12 +131,19 @@ def main():
         
         # Save report
         save_report(report, report_output)
+        if changes is not None:
+            print(changes)
+            save_report(changes, changes_output)
         
         print("\n" + "=" * 70)
         print("✅ SUCCESS! Complete pipeline executed.")
         print("=" * 70)
         print(f"\n📁 Parsed data: {json_output}")
         print(f"📄 EOD Report: {report_output}")
+        if structured:
+            print(f"🧩 Structured: {structured_output}")
+        if changes is not None:
+            print(f"🔁 Changes ({mode}): {changes_output}")
         print("\n✅ Ready to share!\n")
         
     except Exception as e:
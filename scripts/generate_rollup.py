@@ -0,0 +1,79 @@
+"""
+Weekly / Monthly Rollup Report Generator
+
+Builds period reports from cached daily EOD summaries. Only days that have
+not been summarized yet are sent to the AI provider.
+Usage: python generate_rollup.py "input/chat.txt" <week|month> [site_name]
+"""
+
+import sys
+import os
+
+# Add parent directory to path to import from engine
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from engine.parser import parse_whatsapp_chat
+from engine.rollup import ROLLUP_PERIODS, generate_rollup_reports
+from engine.summarizer import save_report
+
+
+def main():
+    if len(sys.argv) < 3 or sys.argv[2] not in ROLLUP_PERIODS:
+        print("=" * 70)
+        print("WhatsApp EOD Report Generator - Rollup Reports")
+        print("=" * 70)
+        print("\nUsage: python generate_rollup.py <input_file> <week|month> [site_name]")
+        print("\nExamples:")
+        print('  python generate_rollup.py "input/team-chat.txt" week')
+        print('  python generate_rollup.py "input/team-chat.txt" month "Site A Construction"')
+        print("\nOutput:")
+        print("  - Daily summaries: output/<filename>_daily/<YYYY-MM-DD>.json (reused between runs)")
+        print("  - Rollup reports: output/<filename>_rollup_<label>.md (e.g. _rollup_2025-W41.md, _rollup_2025-10.md)")
+        print("=" * 70)
+        sys.exit(1)
+
+    input_file = sys.argv[1]
+    period = sys.argv[2]
+    site_name = sys.argv[3] if len(sys.argv) >= 4 else None
+
+    # Check if file exists
+    if not os.path.exists(input_file):
+        print(f"❌ ERROR: File not found: {input_file}")
+        sys.exit(1)
+
+    base_name = os.path.splitext(os.path.basename(input_file))[0]
+    cache_dir = f"output/{base_name}_daily"
+
+    # Ensure output directory exists
+    os.makedirs("output", exist_ok=True)
+
+    try:
+        print(f"📱 Parsing: {input_file}")
+        messages = parse_whatsapp_chat(input_file)
+        print(f"✅ Parsed {len(messages)} messages")
+        print()
+
+        reports = generate_rollup_reports(messages, period, site_name, cache_dir=cache_dir)
+
+        saved = []
+        for label, report in reports.items():
+            report_output = f"output/{base_name}_rollup_{label}.md"
+            save_report(report, report_output)
+            saved.append(report_output)
+
+        print("\n" + "=" * 70)
+        print(f"✅ SUCCESS! Generated {len(saved)} {period}ly rollup report(s).")
+        print("=" * 70)
+        for path in saved:
+            print(f"📄 {path}")
+        print()
+
+    except Exception as e:
+        print(f"\n❌ ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
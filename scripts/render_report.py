@@ -0,0 +1,64 @@
+"""
+Structured Report Renderer
+
+Renders a saved structured report (JSON) to markdown, HTML or plain text
+locally, without another AI call.
+
+Usage:
+    python render_report.py <report_json> [markdown|html|text] [output_file]
+
+Without output_file, writes <report_json name>_rendered.<md|html|txt>, so the
+markdown report written by generate_report.py is never overwritten.
+
+Example:
+    python render_report.py "output/chat_eod_report.json" html
+"""
+
+import sys
+import os
+
+# Add parent directory to path to import from engine
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from engine.structured import RENDER_FORMATS, load_structured_report, render_report
+from engine.summarizer import save_report
+
+FORMAT_EXTENSIONS = {"markdown": ".md", "html": ".html", "text": ".txt"}
+
+
+def main():
+    if len(sys.argv) < 2 or (len(sys.argv) >= 3 and sys.argv[2] not in RENDER_FORMATS):
+        print("Usage: python render_report.py <report_json> [markdown|html|text] [output_file]")
+        print("\nExamples:")
+        print('  python render_report.py "output/chat_eod_report.json"')
+        print('  python render_report.py "output/chat_eod_report.json" html')
+        print('  python render_report.py "output/chat_eod_report.json" text "reports/eod.txt"')
+        sys.exit(1)
+
+    input_file = sys.argv[1]
+    fmt = sys.argv[2] if len(sys.argv) >= 3 else "markdown"
+
+    # Generate output filename if not provided (distinct from generate_report.py's <name>.md)
+    if len(sys.argv) >= 4:
+        output_file = sys.argv[3]
+    else:
+        output_file = os.path.splitext(input_file)[0] + "_rendered" + FORMAT_EXTENSIONS[fmt]
+
+    # Ensure output directory exists
+    if os.path.dirname(output_file):
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+
+    try:
+        report = load_structured_report(input_file)
+        save_report(render_report(report, fmt), output_file)
+
+    except FileNotFoundError:
+        print(f"❌ ERROR: File not found: {input_file}")
+        sys.exit(1)
+    except ValueError as e:
+        print(f"❌ ERROR: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ Usage:
 
 Example:
     python run.py "input/chat.txt"
+    python run.py "input/chat.zip"
     python run.py "input/chat.txt" "output/parsed.json"
 """
 
@@ -15,7 +16,7 @@ import os
 # Add parent directory to path to import from engine
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from engine.parser import parse_whatsapp_chat, save_to_json, validate_messages
+from engine.parser import parse_whatsapp_export, save_to_json, validate_messages
 
 
 def main():
@@ -47,12 +48,18 @@ def main():
         print(f"📱 Parsing WhatsApp chat: {input_file}")
         print()
         
-        # Parse the chat
-        messages = parse_whatsapp_chat(input_file)
+        # Parse the chat (.txt, or .zip "Export with media")
+        messages, manifest = parse_whatsapp_export(input_file)
         
         # Validate and show first 10 messages
         validate_messages(messages, num_to_show=10)
         
+        if manifest:
+            total_mb = sum(entry['size'] for entry in manifest) / (1024 * 1024)
+            linked = sum(len(msg.get('attachments', [])) for msg in messages)
+            print(f"🖼️  Media manifest: {len(manifest)} files ({total_mb:.1f} MB, not extracted), "
+                  f"{linked} attachment references linked")
+        
         # Save to JSON
         save_to_json(messages, output_file)
         